@@ -16,6 +16,9 @@ import os
 # Group 1: Expression (e.g. [[var]])
 TAG_PATTERN = re.compile(r'<ARX\s+\[\[(.+?)\]\]\s*/>', re.DOTALL)
 
+# Single-pass escape table (one C-level scan instead of chained .replace calls)
+ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
 def resolve_dot_notation(data, path):
     """
     Look up 'user.profile.name' in data dictionary.
@@ -56,7 +59,7 @@ def render_arx(content, data):
                 return str(val)
             else:
                 # Standard (Placeholder for future escaping)
-                return str(val).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                return str(val).translate(ESCAPE_TABLE)
         
         # Data missing: Punt (preserve tag)
         return match.group(0)
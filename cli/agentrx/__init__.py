@@ -1,3 +1,22 @@
 """AgentRx CLI — command-line tools for AI-assisted development."""
 
 __version__ = "1.0.0"
+
+# Render API re-exported lazily (PEP 562) so `import agentrx` stays on the
+# stdlib import path; the render module (and PyYAML) loads on first access.
+_RENDER_EXPORTS = ("render", "render_file", "build_context", "strip_front_matter")
+
+__all__ = ["__version__", *_RENDER_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _RENDER_EXPORTS:
+        from importlib import import_module
+
+        mod = import_module(".render", __name__)
+        # Bind every export at once; the ``render`` function deliberately
+        # shadows the submodule attribute importlib just set on the package.
+        for export in _RENDER_EXPORTS:
+            globals()[export] = getattr(mod, export)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,36 @@
 """AgentRx CLI entry point."""
 
+from importlib import import_module
+
 import click
 
 from . import __version__
-from .commands.init import init
-from .commands.prompt import prompt
 
+# Command name → (module under .commands, attribute). Modules are imported
+# lazily so each subcommand only pays for its own dependencies — e.g.
+# `arx prompt list` never imports commands.init. (Group --help still loads
+# every module, since click calls get_command() to render short-help.)
+_COMMANDS = {
+    "init": ("init", "init"),
+    "prompt": ("prompt", "prompt"),
+}
+
+
+class _LazyGroup(click.Group):
+    """A click Group that imports command modules on first use."""
+
+    def list_commands(self, ctx):
+        return sorted(_COMMANDS)
 
-@click.group()
+    def get_command(self, ctx, name):
+        entry = _COMMANDS.get(name)
+        if entry is None:
+            return None
+        module, attr = entry
+        return getattr(import_module(f".commands.{module}", __package__), attr)
+
+
+@click.group(cls=_LazyGroup)
 @click.version_option(version=__version__, prog_name="arx")
 @click.pass_context
 def cli(ctx):
@@ -19,11 +42,6 @@ def cli(ctx):
     ctx.ensure_object(dict)
 
 
-# Register commands
-cli.add_command(init)
-cli.add_command(prompt)
-
-
 def main():
     """Main entry point."""
     cli(obj={})
@@ -16,7 +16,9 @@ Template subdirectory mapping (from ``$AGENTRX_SOURCE/_arx_templates/``):
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import shutil
 from pathlib import Path
 
@@ -29,12 +31,25 @@ from ..render import render_file
 # Helpers
 # ---------------------------------------------------------------------------
 
-_ARX_DOT_RE_STRIP = ".ARX."  # literal substring stripped from filenames
+# ``.ARX.``/``.arx.`` marker stripped from filenames — one compiled pattern so
+# the check and the rewrite are a single scan instead of `in` + replace.
+_ARX_MARKER_RE = re.compile(r"\.(?:ARX|arx)\.")
 
+# Never installed into a workspace. Directories are pruned before descent, so
+# e.g. a __pycache__ left by the template scripts is never even read.
+_JUNK_DIRS = {".git", "__pycache__", ".venv", "node_modules"}
+_JUNK_FILES = {".DS_Store", "Thumbs.db"}
+_JUNK_SUFFIXES = (".pyc", ".pyo")
 
-def _template_source() -> Path:
-    """Resolve the ``_arx_templates`` directory inside ``$AGENTRX_SOURCE``."""
-    src = os.environ.get("AGENTRX_SOURCE")
+
+@functools.lru_cache(maxsize=1)
+def _template_source(src: str) -> Path:
+    """Resolve the ``_arx_templates`` directory inside *src* ($AGENTRX_SOURCE).
+
+    Memoized per process — repeated callers get the resolved Path without
+    re-stat'ing the directory. The caller snapshots the environment once
+    and passes the value in, so the cache key follows the env.
+    """
     if not src:
         raise click.ClickException(
             "AGENTRX_SOURCE is not set. "
@@ -52,8 +67,9 @@ def _dest_name(name: str) -> str:
     ``AGENTS.ARX.md`` → ``AGENTS.md``
     ``.cursorrules.arx`` → ``.cursorrules``
     """
-    if _ARX_DOT_RE_STRIP in name:
-        return name.replace(_ARX_DOT_RE_STRIP, ".")
+    stripped, n = _ARX_MARKER_RE.subn(".", name)
+    if n:
+        return stripped
     if name.endswith(".arx"):
         return name[: -len(".arx")]
     return name
@@ -62,32 +78,81 @@ def _dest_name(name: str) -> str:
 def _copy_tree(src: Path, dst: Path, *, only_if_absent: bool = False, link: bool = False):
     """Recursively copy *src* into *dst*, applying ``.ARX.`` stripping."""
     dst.mkdir(parents=True, exist_ok=True)
-    for item in src.iterdir():
-        target_name = _dest_name(item.name)
-        target = dst / target_name
-        if item.is_dir():
-            _copy_tree(item, target, only_if_absent=only_if_absent, link=link)
-        else:
-            if only_if_absent and target.exists():
+    # scandir's DirEntry carries the file type from the directory read itself,
+    # so classifying entries costs no extra stat() per file (unlike iterdir).
+    with os.scandir(src) as entries:
+        items = list(entries)
+    # Per-file work stays on plain strings (entry.path + os.path.join); Path
+    # objects are only built at directory boundaries for the recursive call.
+    dst_str = os.fspath(dst)
+    for entry in items:
+        is_dir = entry.is_dir()
+        if is_dir:
+            if entry.name in _JUNK_DIRS:
                 continue
-            if link:
-                target.unlink(missing_ok=True)
-                target.symlink_to(item.resolve())
-            else:
-                shutil.copy2(item, target)
+        elif entry.name in _JUNK_FILES or entry.name.endswith(_JUNK_SUFFIXES):
+            continue
+        target = os.path.join(dst_str, _dest_name(entry.name))
+        if is_dir:
+            _copy_tree(Path(entry.path), Path(target), only_if_absent=only_if_absent, link=link)
+        elif link:
+            if only_if_absent and os.path.exists(target):
+                continue
+            try:
+                os.unlink(target)
+            except FileNotFoundError:
+                pass
+            os.symlink(os.path.realpath(entry.path), target)
+        elif only_if_absent:
+            # EAFP: O_EXCL decides "create vs skip" in one syscall instead of
+            # a separate exists() stat followed by the copy.
+            try:
+                fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                continue
+            with open(entry.path, "rb") as src_f, os.fdopen(fd, "wb") as dst_f:
+                shutil.copyfileobj(src_f, dst_f)
+            # Same execute-bit carry-over as the plain-copy branch below.
+            mode = entry.stat().st_mode
+            if mode & 0o111:
+                os.chmod(target, mode & 0o777)
+        else:
+            # copyfile (sendfile on Linux) instead of copy2 — workspace
+            # installs don't need timestamp/metadata preservation. Only the
+            # execute bit is carried over, for bundled scripts.
+            shutil.copyfile(entry.path, target)
+            mode = entry.stat().st_mode
+            if mode & 0o111:
+                os.chmod(target, mode & 0o777)
 
 
-def _write_env(root: Path, env_vars: dict[str, str]):
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write *content* to *path* unless it already matches.
+
+    Keeps idempotent re-inits from touching mtimes (and waking file
+    watchers). Returns ``True`` when the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _write_env(root: Path, env_vars: dict[str, str]) -> bool:
     """Write or overwrite the ``.env`` file with ``ARX_*`` variables."""
     lines = [f'{k}="{v}"\n' for k, v in sorted(env_vars.items())]
-    (root / ".env").write_text("".join(lines), encoding="utf-8")
+    return _write_if_changed(root / ".env", "".join(lines))
 
 
-def _write_config(root: Path, config: dict):
+def _write_config(root: Path, config: dict) -> bool:
     """Write ``arx.config.yaml``."""
-    (root / "arx.config.yaml").write_text(
+    return _write_if_changed(
+        root / "arx.config.yaml",
         yaml.dump(config, default_flow_style=False, sort_keys=False),
-        encoding="utf-8",
     )
 
 
@@ -110,10 +175,17 @@ def init(workspace, agent_files, templates_dir, projects_dir, working_dir, link_
 
     WORKSPACE is the target directory (default: current directory).
     """
-    root = Path(workspace).resolve()
+    # abspath, not resolve(): making the root absolute is pure string work,
+    # while resolve() readlink-walks every component. Symlinked workspace
+    # roots keep the spelling the user gave us, which is also what belongs
+    # in .env / arx.config.yaml. The default "." (the common invocation)
+    # short-circuits to the already-absolute cwd.
+    root = Path.cwd() if workspace in (".", "") else Path(os.path.abspath(workspace))
     root.mkdir(parents=True, exist_ok=True)
 
-    tmpl_src = _template_source()
+    # Snapshot the environment once; everything below works off this value.
+    agentrx_source = os.environ.get("AGENTRX_SOURCE", "")
+    tmpl_src = _template_source(agentrx_source)
 
     # Resolve key paths
     agent_files_path = root / agent_files
@@ -132,7 +204,7 @@ def init(workspace, agent_files, templates_dir, projects_dir, working_dir, link_
 
     # Build environment variables
     env_vars = {
-        "AGENTRX_SOURCE": os.environ.get("AGENTRX_SOURCE", ""),
+        "AGENTRX_SOURCE": agentrx_source,
         "ARX_ROOT": str(root),
         "ARX_AGENT_FILES": str(agent_files_path),
         "ARX_TEMPLATES": str(effective_tmpl),
@@ -161,17 +233,20 @@ def init(workspace, agent_files, templates_dir, projects_dir, working_dir, link_
                 env_vars[f"ARX_{abbr}"] = str(child)
 
     if dry_run:
-        click.echo("Dry run — the following actions would be taken:\n")
-        click.echo(f"  Workspace root : {root}")
-        click.echo(f"  Agent files    : {agent_files_path}")
-        click.echo(f"  Templates      : {effective_tmpl}")
-        click.echo(f"  Projects       : {projects_path}")
-        click.echo(f"  Working docs   : {working_path}")
-        click.echo(f"  Link mode      : {link_arx}")
-        click.echo(f"  Install docs   : {docs}")
-        click.echo(f"\n  .env variables:")
-        for k, v in sorted(env_vars.items()):
-            click.echo(f"    {k}={v}")
+        # One buffered echo instead of a write per line.
+        lines = [
+            "Dry run — the following actions would be taken:\n",
+            f"  Workspace root : {root}",
+            f"  Agent files    : {agent_files_path}",
+            f"  Templates      : {effective_tmpl}",
+            f"  Projects       : {projects_path}",
+            f"  Working docs   : {working_path}",
+            f"  Link mode      : {link_arx}",
+            f"  Install docs   : {docs}",
+            "\n  .env variables:",
+        ]
+        lines += [f"    {k}={v}" for k, v in sorted(env_vars.items())]
+        click.echo("\n".join(lines))
         return
 
     # 1. Copy local templates if requested
@@ -208,18 +283,23 @@ def init(workspace, agent_files, templates_dir, projects_dir, working_dir, link_
                 click.echo(f"Installing project docs → {dest}")
                 _copy_tree(proj_tmpl, dest)
 
-    # 6. Create directory structure
-    for d in [agent_files_path, projects_path, working_path]:
+    # 6. Create directory structure — leaf directories only; mkdir(parents=True)
+    # creates intermediates, so a separate pass over the parents just repeats
+    # stat/mkdir work (working_path is implied by its subdirs).
+    leaves = [agent_files_path, projects_path]
+    leaves += [working_path / subdir for subdir in ("vibes", "deltas", "sessions", "tasks")]
+    for d in leaves:
         d.mkdir(parents=True, exist_ok=True)
 
-    for subdir in ["vibes", "deltas", "sessions", "tasks"]:
-        (working_path / subdir).mkdir(parents=True, exist_ok=True)
-
     # 7. Write .env and config
-    _write_env(root, env_vars)
-    click.echo(f"Wrote {root / '.env'}")
+    if _write_env(root, env_vars):
+        click.echo(f"Wrote {root / '.env'}")
+    else:
+        click.echo(f"Unchanged {root / '.env'}")
 
-    _write_config(root, config)
-    click.echo(f"Wrote {root / 'arx.config.yaml'}")
+    if _write_config(root, config):
+        click.echo(f"Wrote {root / 'arx.config.yaml'}")
+    else:
+        click.echo(f"Unchanged {root / 'arx.config.yaml'}")
 
     click.echo(f"\nWorkspace initialized at {root}")
@@ -9,30 +9,40 @@ Sub-commands:
 
 from __future__ import annotations
 
+import functools
+import heapq
 import os
-import subprocess
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
 
 import click
-import yaml
 
-from ..render import build_context, render, render_file, strip_front_matter
+# subprocess, yaml, and the render helpers are imported inside the commands
+# that need them so 'prompt list' / --help stay off those import paths.
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _working_dir() -> Path:
-    """Return the working-docs directory (``$ARX_WORKING``), falling back to cwd."""
+    """Return the working-docs directory (``$ARX_WORKING``), falling back to cwd.
+
+    Memoized per process, like ``_templates_dir``; the environment does not
+    change mid-invocation.
+    """
     return Path(os.environ.get("ARX_WORKING", "."))
 
 
+@functools.lru_cache(maxsize=1)
 def _templates_dir() -> Path:
-    """Return the templates directory (``$ARX_TEMPLATES``)."""
+    """Return the templates directory (``$ARX_TEMPLATES``).
+
+    Memoized per process; tests that change the environment should call
+    ``_templates_dir.cache_clear()``.
+    """
     d = os.environ.get("ARX_TEMPLATES")
     if not d:
         src = os.environ.get("AGENTRX_SOURCE")
@@ -45,6 +55,24 @@ def _templates_dir() -> Path:
     return Path(d)
 
 
+@functools.lru_cache(maxsize=None)
+def _dir_index(path: str) -> tuple[frozenset, frozenset]:
+    """Snapshot a directory as ``(file_names, dir_names)`` frozensets.
+
+    One scandir replaces a stat per candidate name; a missing or non-dir
+    path just yields empty sets. Cached — the templates tree is static
+    for the lifetime of a CLI invocation.
+    """
+    files, dirs = set(), set()
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                (dirs if e.is_dir() else files).add(e.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return frozenset(files), frozenset(dirs)
+
+
 def _resolve_template(name: str) -> Path:
     """Find a template by subdirectory name under ``$ARX_TEMPLATES``.
 
@@ -52,31 +80,45 @@ def _resolve_template(name: str) -> Path:
     containing an index file.
     """
     base = _templates_dir()
+    files, dirs = _dir_index(str(base))
 
     # Direct file matches
     for ext in (".md", ".yaml", ".yml"):
-        candidate = base / f"{name}{ext}"
-        if candidate.is_file():
-            return candidate
+        if f"{name}{ext}" in files:
+            return base / f"{name}{ext}"
 
     # Subdirectory with index
-    subdir = base / name
-    if subdir.is_dir():
+    if name in dirs:
+        sub_files, _ = _dir_index(str(base / name))
         for idx in ("index.md", "index.yaml", f"{name}.md", f"{name}.yaml"):
-            candidate = subdir / idx
-            if candidate.is_file():
-                return candidate
+            if idx in sub_files:
+                return base / name / idx
 
     raise click.ClickException(f"Template not found: {name} (searched {base})")
 
 
+# Directories already created (or observed) this process — lets repeat calls
+# skip the stat+mkdir walk that mkdir(parents=True, exist_ok=True) performs.
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create *path* (with parents) once per process."""
+    key = str(path)
+    if key not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+    return path
+
+
 def _output_path(short_name: str, subdir: str = "vibes") -> Path:
     """Build the output path: ``$ARX_WORKING/<subdir>/<short_name>_<timestamp>.md``."""
-    ts = datetime.now().strftime("%y%m%d_%H%M")
-    working = _working_dir()
-    dest = working / subdir
-    dest.mkdir(parents=True, exist_ok=True)
-    return dest / f"{short_name}_{ts}.md"
+    from datetime import datetime
+
+    # f-string format spec calls __format__ directly, skipping the
+    # strftime wrapper; the filename is built in the same pass.
+    dest = _ensure_dir(_working_dir() / subdir)
+    return dest / f"{short_name}_{datetime.now():%y%m%d_%H%M}.md"
 
 
 def _run_context_script(script: str, data: dict) -> dict:
@@ -85,27 +127,37 @@ def _run_context_script(script: str, data: dict) -> dict:
     The script receives the current context as JSON on stdin and is expected
     to emit augmented JSON on stdout.
     """
-    import json
+    import subprocess
+
+    from ..render import _json_dumps_bytes, _json_loads
 
     try:
+        # Bytes end-to-end: skips the codec layer subprocess adds in text
+        # mode, and both JSON helpers speak bytes natively.
+        # close_fds=False keeps CPython on its posix_spawn fast path (no
+        # fork of the parent's address space); safe here because the CLI
+        # holds no inheritable descriptors beyond the stdio pipes.
         result = subprocess.run(
             script,
             shell=True,
-            input=json.dumps(data),
+            input=_json_dumps_bytes(data),
             capture_output=True,
-            text=True,
+            close_fds=False,
             timeout=30,
         )
         if result.returncode == 0 and result.stdout.strip():
-            data.update(json.loads(result.stdout))
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as exc:
+            data.update(_json_loads(result.stdout))
+    except (subprocess.TimeoutExpired, ValueError, OSError) as exc:
         click.echo(f"Warning: context script failed: {exc}", err=True)
     return data
 
 
-def _relative_age(ts: float) -> str:
-    """Human-friendly relative age string."""
-    delta = time.time() - ts
+def _relative_age(ts: float, now: float | None = None) -> str:
+    """Human-friendly relative age string.
+
+    Pass *now* when formatting many entries so the clock is read once.
+    """
+    delta = (now if now is not None else time.time()) - ts
     if delta < 60:
         return "just now"
     if delta < 3600:
@@ -142,6 +194,10 @@ def prompt_new(template, text, data_json, data_file, output_path):
     TEMPLATE is a template name resolved from $ARX_TEMPLATES (e.g. arch-facet).
     TEXT is optional plain text to use as the prompt body (instead of a template).
     """
+    import yaml
+
+    from ..render import build_context, render, render_file
+
     ctx = build_context(data_json=data_json, data_file=data_file, stdin_json=True)
 
     if template:
@@ -153,7 +209,10 @@ def prompt_new(template, text, data_json, data_file, output_path):
         script = fm.get("script")
         if script:
             ctx = _run_context_script(script, ctx)
-            body = render(body, ctx, phase="new")
+            # Re-render only when the first pass left tags unresolved —
+            # otherwise the script's additions have nothing to fill in.
+            if "<ARX" in body:
+                body = render(body, ctx, phase="new")
 
         short_name = fm.get("short_name", template)
         subdir = fm.get("subdir", "vibes")
@@ -169,7 +228,7 @@ def prompt_new(template, text, data_json, data_file, output_path):
     # Determine output location
     if output_path:
         dest = Path(output_path)
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest.parent)
     else:
         dest = _output_path(short_name, subdir)
 
@@ -184,7 +243,9 @@ def prompt_new(template, text, data_json, data_file, output_path):
         out_parts.append("---\n")
     out_parts.append(body)
 
-    dest.write_text("".join(out_parts), encoding="utf-8")
+    # Encode once and hand bytes straight to the file — write_text would
+    # layer a TextIOWrapper over the same single write.
+    dest.write_bytes("".join(out_parts).encode("utf-8"))
     click.echo(f"Created {dest}")
 
 
@@ -205,6 +266,8 @@ def prompt_do(prompt_file, data_json, data_file, dry_run, output_path):
     Renders the prompt with the ``:do`` phase, merging data from
     data-file < --data JSON < stdin.
     """
+    from ..render import build_context, render, render_file
+
     ctx = build_context(data_json=data_json, data_file=data_file, stdin_json=True)
     fm, body = render_file(prompt_file, ctx, phase="do")
 
@@ -212,7 +275,8 @@ def prompt_do(prompt_file, data_json, data_file, dry_run, output_path):
     script = fm.get("script")
     if script:
         ctx = _run_context_script(script, ctx)
-        body = render(body, ctx, phase="do")
+        if "<ARX" in body:
+            body = render(body, ctx, phase="do")
 
     if dry_run:
         click.echo("--- DRY RUN ---")
@@ -220,7 +284,7 @@ def prompt_do(prompt_file, data_json, data_file, dry_run, output_path):
         return
 
     if output_path:
-        Path(output_path).write_text(body, encoding="utf-8")
+        Path(output_path).write_bytes(body.encode("utf-8"))
         click.echo(f"Wrote {output_path}")
     else:
         click.echo(body)
@@ -241,20 +305,31 @@ def prompt_list(limit, search_dir):
     else:
         base = _working_dir() / "vibes"
 
-    if not base.is_dir():
+    # Single scandir pass: DirEntry.stat() reuses the data from the directory
+    # read, so each file costs at most one stat — iterdir + per-Path stat
+    # cost three (is_file, sort key, age display).
+    try:
+        with os.scandir(base) as it:
+            files = [
+                (e.stat().st_mtime, e.name)
+                for e in it
+                if e.name.endswith((".md", ".yaml", ".yml")) and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         click.echo(f"No prompts directory found at {base}")
         return
 
-    files = sorted(
-        (f for f in base.iterdir() if f.is_file() and f.suffix in (".md", ".yaml", ".yml")),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True,
-    )
-
     if not files:
         click.echo("No prompt files found.")
         return
 
-    for f in files[:limit]:
-        age = _relative_age(f.stat().st_mtime)
-        click.echo(f"  {age:>10}  {f.name}")
+    # O(n log limit) bounded heap — the full history can be large while the
+    # listing is typically capped at 20. One joined echo instead of a
+    # write per row keeps stdout to a single flush.
+    now = time.time()
+    click.echo(
+        "\n".join(
+            f"  {_relative_age(mtime, now):>10}  {name}"
+            for mtime, name in heapq.nlargest(limit, files)
+        )
+    )
@@ -23,6 +23,29 @@ from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# libyaml's C loader when PyYAML was built against it (several times faster),
+# otherwise the pure-Python SafeLoader. Same safe-loading semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Optional orjson accelerator — parses and emits bytes directly and is
+# several times faster than stdlib json. Never a hard dependency.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """``json.loads`` with the orjson fast path when installed."""
+    return _orjson.loads(data) if _orjson is not None else json.loads(data)
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes, via orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Front-matter helpers
 # ---------------------------------------------------------------------------
@@ -40,7 +63,7 @@ def strip_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
     if not m:
         return {}, text
     try:
-        fm = yaml.safe_load(m.group(1)) or {}
+        fm = yaml.load(m.group(1), Loader=_YAML_LOADER) or {}
     except yaml.YAMLError:
         fm = {}
     return fm, text[m.end() :]
@@ -239,19 +262,26 @@ def build_context(
 
     if data_file:
         p = Path(data_file)
-        if p.exists():
-            raw = p.read_text(encoding="utf-8")
+        try:
+            # EAFP: read directly instead of an exists() stat first. Both
+            # parsers accept bytes, so the UTF-8 decode pass is skipped too.
+            raw = p.read_bytes()
+        except FileNotFoundError:
+            raw = None
+        if raw is not None:
             if p.suffix in (".yaml", ".yml"):
-                ctx.update(yaml.safe_load(raw) or {})
+                ctx.update(yaml.load(raw, Loader=_YAML_LOADER) or {})
             else:
-                ctx.update(json.loads(raw))
+                ctx.update(_json_loads(raw))
 
     if data_json:
-        ctx.update(json.loads(data_json))
+        ctx.update(_json_loads(data_json))
 
     if stdin_json and not sys.stdin.isatty():
-        raw = sys.stdin.read()
+        # Read the pipe as bytes: the JSON parsers accept them directly,
+        # so the TextIOWrapper decode of the whole payload is skipped.
+        raw = sys.stdin.buffer.read()
         if raw.strip():
-            ctx.update(json.loads(raw))
+            ctx.update(_json_loads(raw))
 
     return ctx